@@ -29,6 +29,11 @@ except ImportError:
     from urllib import quote, unquote
     import Queue as queue
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    from .packages.flashmedia.ordereddict import OrderedDict
+
 __all__ = ["is_py2", "is_py3", "is_py33", "is_win32", "str", "bytes",
            "urlparse", "urlunparse", "urljoin", "parse_qsl", "quote",
-           "unquote", "queue", "range"]
+           "unquote", "queue", "range", "OrderedDict"]
@@ -18,7 +18,7 @@ except (ImportError, AttributeError):
     pass
 
 from ...exceptions import PluginError
-from ...utils import parse_json, parse_xml
+from ...utils import HAS_ORJSON, parse_json, parse_xml
 
 __all__ = ["HTTPSession"]
 
@@ -69,6 +69,12 @@ class HTTPSession(Session):
     @classmethod
     def json(cls, res, *args, **kwargs):
         """Parses JSON from a response."""
+        # orjson parses a UTF-8 body directly, no need to decode it first.
+        # Other charsets still need to be decoded by requests.
+        encoding = (res.encoding or "utf-8").lower().replace("_", "-")
+        if HAS_ORJSON and encoding in ("utf-8", "utf8"):
+            return parse_json(res.content, *args, **kwargs)
+
         return parse_json(res.text, *args, **kwargs)
 
     @classmethod
@@ -102,7 +108,10 @@ class HTTPSession(Session):
 
     def resolve_url(self, url):
         """Resolves any redirects and returns the final URL."""
-        return self.get(url, stream=True).url
+        res = self.get(url, stream=True)
+        res.close()
+
+        return res.url
 
     def request(self, method, url, *args, **kwargs):
         acceptable_status = kwargs.pop("acceptable_status", [])
@@ -1,7 +1,11 @@
+from concurrent import futures
 from functools import partial
 from itertools import product
 from operator import eq
 
+# Upper bound on the number of mapped functions that are run concurrently
+MAX_WORKERS = 8
+
 
 class StreamMapper(object):
     """The stream mapper can be used to simplify the process of creating
@@ -9,10 +13,15 @@ class StreamMapper(object):
 
     :param cmp: This callable is used to compare each mapping's key
                 with a value.
+    :param concurrent: Call the mapped functions concurrently in a
+                       thread pool. Only enable this when the mapped
+                       functions are thread-safe and return their streams
+                       rather than being generators.
     """
-    def __init__(self, cmp=eq):
+    def __init__(self, cmp=eq, concurrent=False):
         self._map = []
         self._cmp = cmp
+        self._concurrent = concurrent
 
     def map(self, key, func, *args, **kwargs):
         """Creates a key-function mapping.
@@ -33,10 +42,24 @@ class StreamMapper(object):
         value, (key, func) = args
         return func(value)
 
+    def _map_concurrent(self, values):
+        values = list(values)
+        if len(values) < 2:
+            return map(self._mapped_func, values)
+
+        workers = min(len(values), MAX_WORKERS)
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._mapped_func, values))
+
     def __call__(self, values):
         """Runs through each value and transform it with a mapped function."""
-        values = product(values, self._map)
-        for value in map(self._mapped_func, filter(self._cmp_filter, values)):
+        values = filter(self._cmp_filter, product(values, self._map))
+        if self._concurrent:
+            results = self._map_concurrent(values)
+        else:
+            results = map(self._mapped_func, values)
+
+        for value in results:
             if isinstance(value, tuple) and len(value) == 2:
                 yield value
             else:
@@ -8,7 +8,7 @@ from livestreamer.stream import HDSStream
 SWF_URL = "https://www.connectcast.tv/jwplayer/jwplayer.flash.swf"
 
 _url_re = re.compile("http(s)?://(\w+\.)?connectcast.tv/")
-_manifest_re = re.compile(".*data-playback=\"([^\"]*)\".*")
+_manifest_re = re.compile("data-playback=\"([^\"]*)\"")
 
 
 class ConnectCast(Plugin):
@@ -1,5 +1,6 @@
 import re
 
+from concurrent import futures
 from functools import reduce
 
 from livestreamer.compat import urlparse, range
@@ -82,23 +83,20 @@ class DailyMotion(Plugin):
         res = http.get(STREAM_INFO_URL.format(media_id), cookies=COOKIES)
         media = http.json(res, schema=_media_schema)
 
-        params = extra_params = swf_url = None
-        for __ in media:
-            for __ in __["layerList"]:
-                for __ in __.get("sequenceList", []):
-                    for layer in __["layerList"]:
-                        name = layer["name"]
-                        if name == "video":
-                            params = layer.get("param")
-                        elif name == "reporting":
-                            extra_params = layer.get("param", {})
-                            extra_params = extra_params.get("extraParams", {})
+        layers = dict(
+            (layer["name"], layer.get("param", {}))
+            for sequence in media
+            for layer_list in sequence["layerList"]
+            for sub_sequence in layer_list.get("sequenceList", [])
+            for layer in sub_sequence["layerList"]
+        )
 
+        params = layers.get("video")
         if not params:
             return
 
-        if extra_params:
-            swf_url = extra_params.get("videoSwfURL")
+        extra_params = layers.get("reporting", {}).get("extraParams", {})
+        swf_url = extra_params.get("videoSwfURL")
 
         mode = params.get("mode")
         if mode == "live":
@@ -106,17 +104,31 @@ class DailyMotion(Plugin):
         elif mode == "vod":
             return self._get_vod_streams(params)
 
+    def _fetch_live_url(self, url):
+        try:
+            return http.get(url, exception=IOError)
+        except IOError:
+            pass
+
     def _get_live_streams(self, params, swf_url):
+        qualities = []
         for key, quality in QUALITY_MAP.items():
             key_url = "{0}URL".format(key)
             url = params.get(key_url)
 
-            if not url:
-                continue
+            if url:
+                qualities.append((key, quality, url))
+
+        if not qualities:
+            return
+
+        # Each quality is a separate round-trip, so fetch them concurrently
+        urls = [url for key, quality, url in qualities]
+        with futures.ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            responses = list(executor.map(self._fetch_live_url, urls))
 
-            try:
-                res = http.get(url, exception=IOError)
-            except IOError:
+        for (key, quality, url), res in zip(qualities, responses):
+            if res is None:
                 continue
 
             if quality == "hds":
@@ -8,7 +8,9 @@ from livestreamer.stream import (
     HTTPStream, HLSStream
 )
 
-API_URL = "http://www.douyutv.com/api/v1/room/{0}?aid=android&client_sys=android&time={1}&auth={2}"
+API_URL = "http://www.douyutv.com/api/v1/{0}&auth={1}"
+API_PATH = "room/{0}?aid=android&client_sys=android&time={1}"
+API_SECRET = "1231"
 SHOW_STATUS_ONLINE = 1
 SHOW_STATUS_OFFLINE = 2
 STREAM_WEIGHTS = {
@@ -25,7 +27,7 @@ _room_schema = validate.Schema(
     {
         "data": validate.any(None, {
             "show_status": validate.all(
-                validate.text,
+                validate.any(validate.text, int),
                 validate.transform(int)
             ),
             "rtmp_url": validate.text,
@@ -59,10 +61,10 @@ class Douyutv(Plugin):
         match = _url_re.match(self.url)
         channel = match.group("channel")
 
-        ts = int(time.time())
-        sign = hashlib.md5(("room/{0}?aid=android&client_sys=android&time={1}".format(channel, ts) + "1231").encode("ascii")).hexdigest()
+        path = API_PATH.format(channel, int(time.time()))
+        sign = hashlib.md5((path + API_SECRET).encode("ascii")).hexdigest()
 
-        res = http.get(API_URL.format(channel, ts, sign))
+        res = http.get(API_URL.format(path, sign))
         room = http.json(res, schema=_room_schema)
         if not room:
             return
@@ -70,17 +72,16 @@ class Douyutv(Plugin):
         if room["show_status"] != SHOW_STATUS_ONLINE:
             return
 
-        hls_url = "{room[hls_url]}?wsiphost=local".format(room=room)
+        hls_url = room["hls_url"] + "?wsiphost=local"
         hls_stream = HLSStream(self.session, hls_url)
         yield "hls", hls_stream
 
-        url = "{room[rtmp_url]}/{room[rtmp_live]}".format(room=room)
-        stream = HTTPStream(self.session, url)
+        rtmp_url = room["rtmp_url"] + "/"
+        stream = HTTPStream(self.session, rtmp_url + room["rtmp_live"])
         yield "source", stream
 
         for name, url in room["rtmp_multi_bitrate"].items():
-            url = "{room[rtmp_url]}/{url}".format(room=room, url=url)
-            stream = HTTPStream(self.session, url)
+            stream = HTTPStream(self.session, rtmp_url + url)
             yield name, stream
 
 __plugin__ = Douyutv
@@ -23,6 +23,7 @@ STREAM_TYPES = ("hls", "rtmp")
 _url_re = re.compile("http(s)?://(\w+\.)?filmon.com/(channel|tv|vod)/")
 _channel_id_re = re.compile("/channels/(\d+)/extra_big_logo.png")
 _vod_id_re = re.compile("movie_id=(\d+)")
+_rtmp_app_re = re.compile("^\w+://[^/?#]*/?([^?#]*)(?:\?([^#]*))?")
 
 _channel_schema = validate.Schema({
     "streams": [{
@@ -67,11 +68,11 @@ class Filmon(Plugin):
     def _create_rtmp_stream(self, stream, live=True):
         rtmp = stream["url"]
         playpath = stream["name"]
-        parsed = urlparse(rtmp)
-        if parsed.query:
-            app = "{0}?{1}".format(parsed.path[1:], parsed.query)
+        path, query = _rtmp_app_re.match(rtmp).groups()
+        if query:
+            app = "{0}?{1}".format(path, query)
         else:
-            app = parsed.path[1:]
+            app = path
 
         if playpath.endswith(".mp4"):
             playpath = "mp4:" + playpath
@@ -5,6 +5,8 @@ This plugin is using the same API as the mobile app.
 
 import re
 
+from concurrent import futures
+
 from livestreamer.plugin import Plugin
 from livestreamer.plugin.api import http, validate
 from livestreamer.stream import HLSStream
@@ -31,6 +33,13 @@ class GOMeXP(Plugin):
         root = http.xml(res)
         return root.findtext("./cube/cubeid")
 
+    def _parse_playlist(self, url):
+        try:
+            return HLSStream.parse_variant_playlist(self.session, url)
+        except IOError as err:
+            self.logger.error("Failed to open playlist: {0}", err)
+            return {}
+
     def _get_streams(self):
         cubeid = self._get_live_cubeid()
         if not cubeid:
@@ -38,14 +47,13 @@ class GOMeXP(Plugin):
 
         res = http.get(API_URL_LIVE, params=dict(cubeid=cubeid))
         entries = http.xml(res, schema=_entries_schema)
+        if not entries:
+            return
+
         streams = {}
-        for url in entries:
-            try:
-                streams.update(
-                    HLSStream.parse_variant_playlist(self.session, url)
-                )
-            except IOError as err:
-                self.logger.error("Failed to open playlist: {0}", err)
+        with futures.ThreadPoolExecutor(max_workers=len(entries)) as executor:
+            for playlist in executor.map(self._parse_playlist, entries):
+                streams.update(playlist)
 
         return streams
 
@@ -1,5 +1,7 @@
 import re
 
+from concurrent import futures
+
 from livestreamer.plugin import Plugin
 from livestreamer.plugin.api import http
 from livestreamer.stream import HLSStream
@@ -23,6 +25,9 @@ _ddos_re = re.compile(
 class GoodGame(Plugin):
     @classmethod
     def can_handle_url(self, url):
+        if "goodgame.ru" not in url:
+            return False
+
         return _url_re.match(url)
 
     def _check_stream(self, url):
@@ -46,13 +51,17 @@ class GoodGame(Plugin):
             return
 
         stream_id = match.group(2)
+        urls = dict((name, HLS_URL_FORMAT.format(stream_id, url_suffix))
+                    for name, url_suffix in QUALITIES.items())
+
         streams = {}
-        for name, url_suffix in QUALITIES.items():
-            url = HLS_URL_FORMAT.format(stream_id, url_suffix)
-            if not self._check_stream(url):
-                continue
+        with futures.ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            checks = dict((name, executor.submit(self._check_stream, url))
+                          for name, url in urls.items())
 
-            streams[name] = HLSStream(self.session, url)
+            for name, check in checks.items():
+                if check.result():
+                    streams[name] = HLSStream(self.session, urls[name])
 
         return streams
 
@@ -12,16 +12,19 @@ _url_re = re.compile("http(s)?://(?:\w+.)?\livecoding\.tv")
 class LivecodingTV(Plugin):
     @classmethod
     def can_handle_url(cls, url):
+        if "livecoding.tv" not in url:
+            return False
+
         return _url_re.match(url)
 
     def _get_streams(self):
         res = http.get(self.url)
         match = _rtmp_re.search(res.text)
-        rtmp_url = match.group(0)
-
         if not match:
             return
 
+        rtmp_url = match.group(0)
+
         stream = RTMPStream(self.session, {
             "rtmp": rtmp_url,
             "pageUrl": self.url,
@@ -28,6 +28,14 @@ from livestreamer.stream import HTTPStream, HLSStream
 API_URL_MEDIA           = "https://api.media.ccc.de"
 API_URL_STREAMING_MEDIA = "https://streaming.media.ccc.de/streams/v1.json"
 
+# recordings with these mime types are not supported
+SKIPPED_MIME_TYPES = ('vnd.voc/mp4-web',)
+# recordings with these mime types have a fixed stream name
+MIME_TYPE_NAMES    = {
+    'vnd.voc/h264-hd': "1080p",
+    'vnd.voc/h264-lq': "420p",
+}
+
 # http(s)://media.ccc.de/path/to/talk.html
 _url_media_re           = re.compile("(?P<scheme>http|https)"
                                      ":\/\/"
@@ -40,6 +48,11 @@ _url_streaming_media_re = re.compile("(?P<scheme>http|https)"
                                      "\/"
                                      "(?P<room>.*)"
                                      "\/")
+# {event_id: 1234, ...} in the talk html page
+_event_id_re            = re.compile(r"{event_id:\s(?P<event_id>\d+),")
+
+# event ids of the talk pages seen by this process, keyed by URL
+_event_ids              = {}
 
 def get_event_id(url):
     """Extract event id from talk html page.
@@ -49,7 +62,7 @@ def get_event_id(url):
     :param url: talk URL
 
     """
-    match = re.search(r"{event_id:\s(?P<event_id>\d+),.*}", http.get(url).text)
+    match = _event_id_re.search(http.get(url).text)
 
     try:
         event_id = int(match.group('event_id'))
@@ -76,23 +89,21 @@ def parse_media_json(json_object):
     """
     recordings = {}
     for recording in json_object['recordings']:
-        match       = re.search(r".*\/(?P<format>.*)", recording['mime_type'])
-        file_format = match.group('format')
+        mime_type         = recording['mime_type']
+        display_mime_type = recording['display_mime_type']
 
-        if recording['mime_type'] == 'vnd.voc/mp4-web' or\
-            recording['display_mime_type'] == 'video/webm':
+        if mime_type in SKIPPED_MIME_TYPES or\
+            display_mime_type == 'video/webm':
             continue
-        elif recording['mime_type'] == 'vnd.voc/h264-hd':
+
+        if mime_type in MIME_TYPE_NAMES:
+            name = MIME_TYPE_NAMES[mime_type]
+        elif display_mime_type.startswith("audio"):
+            name = "audio_%s" % mime_type.rpartition('/')[2]
+        elif recording['hd'] == 'True':
             name = "1080p"
-        elif recording['mime_type'] == 'vnd.voc/h264-lq':
-            name = "420p"
-        elif re.match(r"audio", recording['display_mime_type']):
-            name = "audio_%s" % file_format
         else:
-            if recording['hd'] == 'True':
-                name = "1080p"
-            else:
-                name = "420p"
+            name = "420p"
 
         recordings[name] = recording['recording_url']
 
@@ -107,12 +118,15 @@ def parse_streaming_media_json(json_object, room_from_url):
     :param room_from_url:
 
     """
+    # room links are http(s)://streaming.media.ccc.de/${room}/
+    room_links = tuple("%s://streaming.media.ccc.de/%s" % (scheme, room_from_url)
+                       for scheme in ("http", "https"))
+
     streams = {}
     for group in json_object:
         for room in group['rooms']:
             # only consider to requested room
-            match = _url_streaming_media_re.match(room['link'])
-            if not match.group('room') == room_from_url:
+            if room['link'].rpartition('/')[0] not in room_links:
                 continue
 
             for stream in room['streams']:
@@ -122,8 +136,10 @@ def parse_streaming_media_json(json_object, room_from_url):
                 else:
                     language = 'translated'
 
+                urls = stream['urls']
+
                 # get available hls stream urls
-                hls_stream = stream['urls'].get('hls')
+                hls_stream = urls.get('hls')
                 if hls_stream:
                     stream_url = hls_stream['url']
                     name = None
@@ -141,14 +157,14 @@ def parse_streaming_media_json(json_object, room_from_url):
                         streams[long_name] = stream_url
 
                 # get available audio only mpeg urls
-                mp3_stream = stream['urls'].get('mp3')
+                mp3_stream = urls.get('mp3')
                 if mp3_stream:
                     stream_url    = mp3_stream['url']
                     name          = "audio_%s_mpeg" % language
                     streams[name] = stream_url
 
                 # get available audio only opus urls
-                opus_stream = stream['urls'].get('opus')
+                opus_stream = urls.get('opus')
                 if opus_stream:
                     stream_url    = opus_stream['url']
                     name          = "audio_%s_opus" % language
@@ -160,6 +176,9 @@ def parse_streaming_media_json(json_object, room_from_url):
 class media_ccc_de(Plugin):
     @classmethod
     def can_handle_url(self, url):
+        if "media.ccc.de" not in url:
+            return False
+
         return _url_media_re.match(url) or _url_streaming_media_re.match(url)
 
     def _get_streams(self):
@@ -173,16 +192,22 @@ class media_ccc_de(Plugin):
                                                       match.group('room'))
 
             for stream_name, stream_url in live_streams.items():
-                if re.search(r"m3u8", live_streams[stream_name]):
+                if "m3u8" in stream_url:
                     streams[stream_name] = HLSStream(self.session,\
                                                         stream_url)
                 else:
                     streams[stream_name] = HTTPStream(self.session,\
                                                         stream_url)
 
-        # media.ccc.de
-        elif _url_media_re.search(self.url):
-            event_id   = get_event_id(self.url)
+        # media.ccc.de, the only other URL accepted by can_handle_url()
+        else:
+            # a talk page always refers to the same event, so avoid
+            # fetching and scanning the whole page again
+            event_id   = _event_ids.get(self.url)
+            if not event_id:
+                event_id = get_event_id(self.url)
+                _event_ids[self.url] = event_id
+
             query_url  = "%s/public/events/%i" % (API_URL_MEDIA, event_id)
             recordings = parse_media_json(get_json(query_url))
 
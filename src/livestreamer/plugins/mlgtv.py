@@ -85,7 +85,8 @@ class MLGTV(Plugin):
         items = http.json(res, schema=_stream_schema)
 
         mapper = StreamMapper(
-            cmp=lambda type, stream: stream["format"] == type
+            cmp=lambda type, stream: stream["format"] == type,
+            concurrent=True
         )
         mapper.map("hls", self._create_streams, HLSStream.parse_variant_playlist)
         mapper.map("hds", self._create_streams, HDSStream.parse_manifest)
@@ -14,14 +14,14 @@ HLS_RUV_LIVE_URL = "http://ruvruv-live.hls.adaptive.level3.net/ruv/ruv/index/str
 HLS_RADIO_LIVE_URL = "http://sip-live.hds.adaptive.level3.net/hls-live/ruv-{0}/_definst_/live/stream1.m3u8"
 HLS_SARPURINN_URL = "http://sip-ruv-vod.dcp.adaptive.level3.net/{0}/{1}{2}.{3}.m3u8"
 
+RTMP_RUV_QUALITIES = ("720p", "480p", "360p", "240p")
+HLS_RUV_QUALITIES = ("240p", "360p", "480p", "720p")
+
 
 _live_url_re = re.compile(r"""^(?:https?://)?(?:www\.)?ruv\.is/
                                 (?P<channel_path>
                                     ruv|
-                                    ras1|
-                                    ras-1|
-                                    ras2|
-                                    ras-2|
+                                    ras-?[12]|
                                     rondo
                                 )
                                 /?
@@ -29,14 +29,8 @@ _live_url_re = re.compile(r"""^(?:https?://)?(?:www\.)?ruv\.is/
 
 _sarpurinn_url_re = re.compile(r"""^(?:https?://)?(?:www\.)?ruv\.is/sarpurinn/
                                     (?:
-                                        ruv|
-                                        ruv2|
-                                        ruv-2|
-                                        ruv-aukaras|
-                                        ras1|
-                                        ras-1|
-                                        ras2|
-                                        ras-2
+                                        ruv(?:-?2|-aukaras)?|
+                                        ras-?[12]
                                     )
                                     /
                                     [a-zA-Z0-9_-]+
@@ -72,10 +66,7 @@ _id_map = {
 class Ruv(Plugin):
     @classmethod
     def can_handle_url(cls, url):
-        if _live_url_re.match(url):
-            return _live_url_re.match(url)
-        else:
-            return _sarpurinn_url_re.match(url)
+        return _live_url_re.match(url) or _sarpurinn_url_re.match(url)
 
     def __init__(self, url):
         Plugin.__init__(self, url)
@@ -91,9 +82,7 @@ class Ruv(Plugin):
         stream_id = _id_map[self.channel_path]
 
         if stream_id == "ruv":
-            qualities_rtmp = ["720p", "480p", "360p", "240p"]
-
-            for i, quality in enumerate(qualities_rtmp):
+            for i, quality in enumerate(RTMP_RUV_QUALITIES):
                 yield quality, RTMPStream(
                     self.session,
                     {
@@ -103,8 +92,7 @@ class Ruv(Plugin):
                     }
                 )
 
-            qualities_hls = ["240p", "360p", "480p", "720p"]
-            for i, quality_hls in enumerate(qualities_hls):
+            for i, quality_hls in enumerate(HLS_RUV_QUALITIES):
                 yield quality_hls, HLSStream(
                     self.session,
                     HLS_RUV_LIVE_URL.format(i+1)
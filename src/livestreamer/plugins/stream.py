@@ -21,6 +21,10 @@ PROTOCOL_MAP = {
 }
 PARAMS_REGEX = r"(\w+)=({.+?}|\[.+?\]|\(.+?\)|'(?:[^'\\]|\\')*'|\"(?:[^\"\\]|\\\")*\"|\S+)"
 
+_params_re = re.compile(PARAMS_REGEX)
+_scheme_re = re.compile("^\w+://(.+)")
+_http_scheme_re = re.compile("^http(s)?://")
+
 class StreamURL(Plugin):
     @classmethod
     def can_handle_url(self, url):
@@ -30,7 +34,7 @@ class StreamURL(Plugin):
 
     def _parse_params(self, params):
         rval = {}
-        matches = re.findall(PARAMS_REGEX, params)
+        matches = _params_re.findall(params)
 
         for key, value in matches:
             try:
@@ -51,10 +55,10 @@ class StreamURL(Plugin):
 
         split = self.url.split(" ")
         url = split[0]
-        urlnoproto = re.match("^\w+://(.+)", url).group(1)
+        urlnoproto = _scheme_re.match(url).group(1)
 
         # Prepend http:// if needed.
-        if cls != RTMPStream and not re.match("^http(s)?://", urlnoproto):
+        if cls != RTMPStream and not _http_scheme_re.match(urlnoproto):
             urlnoproto = "http://{0}".format(urlnoproto)
 
         params = (" ").join(split[1:])
@@ -6,7 +6,7 @@ from livestreamer.plugin.api import http, validate
 from livestreamer.stream import RTMPStream, HLSStream
 
 _url_re = re.compile("http(s)?://(\w+\.)?streamup.com/(?P<channel>[^/?]+)")
-_hls_manifest_re = re.compile('HlsManifestUrl:\\s*"//"\\s*\\+\\s*response\\s*\\+\\s*"(.+)"')
+_hls_manifest_re = re.compile('HlsManifestUrl:\\s*"//"\\s*\\+\\s*response\\s*\\+\\s*"([^"]+)"')
 
 class StreamupCom(Plugin):
     @classmethod
@@ -17,6 +17,9 @@ class StreamupCom(Plugin):
         res = http.get(self.url)
         if not res: return
         match = _hls_manifest_re.search(res.text)
+        if not match:
+            return
+
         url = match.group(1)
         hls_url = "http://video-cdn.streamup.com{}".format(url)
         return HLSStream.parse_variant_playlist(self.session, hls_url)
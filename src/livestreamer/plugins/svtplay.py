@@ -13,7 +13,7 @@ _url_re = re.compile("""
         svtflow |
         oppetarkiv
     )
-    .se
+    \.se
 """, re.VERBOSE)
 
 _video_schema = validate.Schema(
@@ -49,7 +49,10 @@ class SVTPlay(Plugin):
         res = http.get(self.url, params=dict(output="json"))
         videos = http.json(res, schema=_video_schema)
 
-        mapper = StreamMapper(cmp=lambda type, video: video["playerType"] == type)
+        mapper = StreamMapper(
+            cmp=lambda type, video: video["playerType"] == type,
+            concurrent=True
+        )
         mapper.map("ios", self._create_streams, "HLS", HLSStream.parse_variant_playlist)
         mapper.map("flash", self._create_streams, "HDS", HDSStream.parse_manifest)
 
@@ -1,15 +1,18 @@
 import re
 
+from bisect import bisect_right
 from collections import namedtuple
-from functools import partial
+from concurrent import futures
 from random import randint
-from time import sleep
+from time import sleep, time
 
-from livestreamer.compat import urlparse, urljoin, range
+from livestreamer.compat import urlparse, urljoin
 from livestreamer.exceptions import StreamError, PluginError, NoStreamsError
 from livestreamer.plugin import Plugin, PluginOptions
 from livestreamer.plugin.api import http, validate
-from livestreamer.stream import RTMPStream, HLSStream, HTTPStream, Stream
+from livestreamer.stream import (
+    RTMPStream, HLSStream, HTTPStream, Stream, StreamIOIterWrapper
+)
 from livestreamer.stream.flvconcat import FLVTagConcat
 from livestreamer.stream.segmented import (
     SegmentedStreamReader, SegmentedStreamWriter, SegmentedStreamWorker
@@ -22,7 +25,7 @@ except ImportError:
     HAS_LIBRTMP = False
 
 _url_re = re.compile("""
-    http(s)?://(www\.)?ustream.tv
+    http(s)?://(www\.)?ustream\.tv
     (?:
         (/embed/|/channel/id/)(?P<channel_id>\d+)
     )?
@@ -30,7 +33,14 @@ _url_re = re.compile("""
         /recorded/(?P<video_id>\d+)
     )?
 """, re.VERBOSE)
-_channel_id_re = re.compile("\"channelId\":(\d+)")
+# The id must be followed by a non-digit so that a partially downloaded
+# page can't match a truncated id
+_channel_id_re = re.compile(b"\"channelId\":(\\d+)(?=\\D)")
+_channel_id_end_re = re.compile(b"\"channelId\":(\\d+)$")
+_mobile_stream_re = re.compile("mobile_(\w+)")
+
+# How long to wait for a HLS transcode to be started, in seconds
+HLS_TRANSCODE_TIMEOUT = 30
 
 HLS_PLAYLIST_URL = (
     "http://iphone-streaming.ustream.tv"
@@ -108,10 +118,16 @@ _channel_schema = validate.Schema({
 
 Chunk = namedtuple("Chunk", "num url offset")
 
+# UHS chunks are downloaded in full, so read them in large blocks to
+# keep the number of reads (and FLV parser re-entries) low.
+CHUNK_READ_SIZE = 256 * 1024
+
+# Collected FLV tags are written to the buffer once they reach this size
+CHUNK_WRITE_SIZE = 256 * 1024
+
 
 if HAS_LIBRTMP:
     from io import BytesIO
-    from time import time
 
     from librtmp.rtmp import RTMPTimeoutError, PACKET_TYPE_INVOKE
     from livestreamer.packages.flashmedia.types import AMF0Value
@@ -229,6 +245,7 @@ class UHSStreamWriter(SegmentedStreamWriter):
                 params["start"] = chunk.offset
 
             return http.get(chunk.url,
+                            stream=True,
                             timeout=self.timeout,
                             params=params,
                             exception=StreamError)
@@ -236,11 +253,19 @@ class UHSStreamWriter(SegmentedStreamWriter):
             self.logger.error("Failed to open chunk {0}: {1}", chunk.num, err)
             return self.fetch(chunk, retries - 1)
 
-    def write(self, chunk, res, chunk_size=8192):
+    def write(self, chunk, res, chunk_size=CHUNK_READ_SIZE):
+        fd = StreamIOIterWrapper(res.iter_content(chunk_size))
+
+        # FLV tags are often small, so collect them and write to the
+        # buffer in larger blocks instead of locking it once per tag.
+        pending = bytearray()
         try:
-            for data in self.concater.iter_chunks(buf=res.content,
+            for data in self.concater.iter_chunks(fd=fd,
                                                   skip_header=not chunk.offset):
-                self.reader.buffer.write(data)
+                pending += data
+                if len(pending) >= CHUNK_WRITE_SIZE:
+                    self.reader.buffer.write(pending)
+                    pending = bytearray()
 
                 if self.closed:
                     break
@@ -249,15 +274,20 @@ class UHSStreamWriter(SegmentedStreamWriter):
         except IOError as err:
             self.logger.error("Failed to read chunk {0}: {1}", chunk.num, err)
 
+        if pending:
+            self.reader.buffer.write(pending)
+
 
 class UHSStreamWorker(SegmentedStreamWorker):
     def __init__(self, *args, **kwargs):
         SegmentedStreamWorker.__init__(self, *args, **kwargs)
 
         self.chunk_ranges = {}
+        self.chunk_starts = []
         self.chunk_id = None
+        self.chunk_id_min = None
         self.chunk_id_max = None
-        self.chunks = []
+        self.chunk_offset = 0
         self.filename_format = ""
         self.module_info_reload_time = 2
         self.process_module_info()
@@ -322,32 +352,41 @@ class UHSStreamWorker(SegmentedStreamWorker):
 
         chunk_id = int(result["chunkId"])
         chunk_offset = int(result["offset"])
-        chunk_range = dict(map(partial(map, int), chunk_range.items()))
+        chunk_range = dict((int(start), int(chunk_hash))
+                           for start, chunk_hash in chunk_range.items())
 
         self.chunk_ranges.update(chunk_range)
-        self.chunk_id_min = sorted(chunk_range)[0]
-        self.chunk_id_max = int(result["chunkId"])
-        self.chunks = [Chunk(i, self.format_chunk_url(i),
-                             not self.chunk_id and i == chunk_id and chunk_offset)
-                       for i in range(self.chunk_id_min, self.chunk_id_max + 1)]
+        self.chunk_starts = sorted(self.chunk_ranges)
+        self.chunk_id_min = min(chunk_range)
+        self.chunk_id_max = chunk_id
 
-        if self.chunk_id is None and self.chunks:
+        if self.chunk_id is None and self.chunk_id_min <= chunk_id:
             self.chunk_id = chunk_id
+            self.chunk_offset = chunk_offset
 
     def format_chunk_url(self, chunk_id):
-        chunk_hash = ""
-        for chunk_start in sorted(self.chunk_ranges):
-            if chunk_id >= chunk_start:
-                chunk_hash = self.chunk_ranges[chunk_start]
+        # Use the hash of the last range starting at or before this chunk
+        index = bisect_right(self.chunk_starts, chunk_id)
+        if index:
+            chunk_hash = self.chunk_ranges[self.chunk_starts[index - 1]]
+        else:
+            chunk_hash = ""
 
         return self.filename_format % (chunk_id, chunk_hash)
 
-    def valid_chunk(self, chunk):
-        return self.chunk_id and chunk.num >= self.chunk_id
-
     def iter_segments(self):
         while not self.closed:
-            for chunk in filter(self.valid_chunk, self.chunks):
+            # Chunks are created as they are queued, skipping any that
+            # have fallen out of the advertised range.
+            while self.chunk_id and self.chunk_id <= self.chunk_id_max:
+                num = max(self.chunk_id, self.chunk_id_min)
+                if num > self.chunk_id_max:
+                    break
+
+                chunk = Chunk(num, self.format_chunk_url(num),
+                              self.chunk_offset)
+                self.chunk_offset = 0
+
                 self.logger.debug("Adding chunk {0} to queue", chunk.num)
                 yield chunk
 
@@ -422,7 +461,7 @@ class UStreamTV(Plugin):
 
     @classmethod
     def stream_weight(cls, stream):
-        match = re.match("mobile_(\w+)", stream)
+        match = _mobile_stream_re.match(stream)
         if match:
             weight, group = Plugin.stream_weight(match.group(1))
             weight -= 1
@@ -435,18 +474,44 @@ class UStreamTV(Plugin):
         return weight, group
 
     def _get_channel_id(self):
-        res = http.get(self.url)
-        match = _channel_id_re.search(res.text)
-        if match:
-            return int(match.group(1))
+        # The channel id is usually near the top of the page, so stop
+        # downloading as soon as it has been found.
+        res = http.get(self.url, stream=True)
+        data = bytearray()
+        try:
+            for chunk in res.iter_content(8192):
+                # Overlap with the previous chunk in case the id is split
+                pos = max(len(data) - 64, 0)
+                data.extend(chunk)
+
+                match = _channel_id_re.search(data, pos)
+                if match:
+                    return int(match.group(1))
+
+            # The id may be the very last thing in the page
+            match = _channel_id_end_re.search(data, max(len(data) - 64, 0))
+            if match:
+                return int(match.group(1))
+        finally:
+            res.close()
 
-    def _get_hls_streams(self, channel_id, wait_for_transcode=False):
+    def _get_hls_streams(self, channel_id, wait_for_transcode=False,
+                         probed=False):
         # HLS streams are created on demand, so we may have to wait
-        # for a transcode to be started.
-        attempts = wait_for_transcode and 10 or 1
+        # for a transcode to be started. Poll often at first since the
+        # transcode is usually quick to start, then back off.
+        timeout = wait_for_transcode and HLS_TRANSCODE_TIMEOUT or 0
+        deadline = time() + timeout
+        delay = 0.5
         playlist_url = HLS_PLAYLIST_URL.format(channel_id)
         streams = {}
-        while attempts and not streams:
+
+        # The playlist was just fetched empty, so wait before the first retry
+        if probed:
+            sleep(delay)
+            delay *= 2
+
+        while True:
             try:
                 streams = HLSStream.parse_variant_playlist(self.session,
                                                            playlist_url,
@@ -455,8 +520,12 @@ class UStreamTV(Plugin):
                 # Channel is probably offline
                 break
 
-            attempts -= 1
-            sleep(3)
+            remaining = deadline - time()
+            if streams or remaining <= 0:
+                break
+
+            sleep(min(delay, remaining))
+            delay = min(delay * 2, 8)
 
         return streams
 
@@ -478,20 +547,21 @@ class UStreamTV(Plugin):
         conn = create_ums_connection(app, media_id, self.url, password)
 
         attempts = 3
-        while conn.connected and attempts:
-            try:
-                result = conn.process_packets(invoked_method="moduleInfo",
-                                              timeout=10)
-            except (IOError, librtmp.RTMPError) as err:
-                raise PluginError("Failed to get stream info: {0}".format(err))
-
-            try:
-                result = _module_info_schema.validate(result)
-                break
-            except PluginError:
-                attempts -= 1
+        try:
+            while conn.connected and attempts:
+                try:
+                    result = conn.process_packets(invoked_method="moduleInfo",
+                                                  timeout=10)
+                except (IOError, librtmp.RTMPError) as err:
+                    raise PluginError("Failed to get stream info: {0}".format(err))
 
-        conn.close()
+                try:
+                    result = _module_info_schema.validate(result)
+                    break
+                except PluginError:
+                    attempts -= 1
+        finally:
+            conn.close()
 
         if schema:
             result = schema.validate(result)
@@ -544,6 +614,12 @@ class UStreamTV(Plugin):
         return streams
 
     def _get_live_streams(self, channel_id):
+        # Probe for already transcoded HLS streams while the desktop
+        # streams are being fetched.
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        hls_streams = executor.submit(self._get_hls_streams, channel_id)
+        executor.shutdown(wait=False)
+
         has_desktop_streams = False
         if HAS_LIBRTMP:
             try:
@@ -563,8 +639,11 @@ class UStreamTV(Plugin):
             )
 
         try:
-            streams = self._get_hls_streams(channel_id,
-                                            wait_for_transcode=not has_desktop_streams)
+            streams = hls_streams.result()
+            if not streams and not has_desktop_streams:
+                streams = self._get_hls_streams(channel_id,
+                                                wait_for_transcode=True,
+                                                probed=True)
 
             # TODO: Replace with "yield from" when dropping Python 2.
             for stream in streams.items():
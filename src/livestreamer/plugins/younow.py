@@ -9,24 +9,19 @@ from livestreamer.stream import RTMPStream
 jsonapi= "http://www.younow.com/php/api/broadcast/info/curId=0/user="
 
 # http://younow.com/channel/
-_url_re = re.compile("http(s)?://(\w+.)?younow.com/(?P<channel>[^/&?]+)")
+_url_re = re.compile("http(s)?://(\w+\.)?younow\.com/(?P<channel>[^/&?]+)")
 
 def getStreamURL(channel):
     url = jsonapi + channel
     res = http.get(url)
     streamerinfo = http.json(res)
-    #print(streamerinfo)
 
-    if not any("media" in s for s in streamerinfo):
-        print ("User offline or invalid")
+    # User is offline or does not exist
+    if "media" not in streamerinfo:
         return
-    else:
-        streamdata = streamerinfo['media']
-        #print(streamdata)
-        streamurl = "rtmp://" + streamdata['host'] + streamdata['app'] + "/" + streamdata['stream']
-        #print (streamurl)
 
-    return streamurl
+    streamdata = streamerinfo["media"]
+    return "rtmp://{host}{app}/{stream}".format(**streamdata)
 
 class younow(Plugin):
     @classmethod
@@ -5,12 +5,15 @@ import sys
 import traceback
 
 from . import plugins, __version__
-from .compat import urlparse, is_win32
+from .compat import urlparse, is_win32, OrderedDict
 from .exceptions import NoPluginError, PluginError
 from .logger import Logger
 from .options import Options
 from .plugin import api
 
+# Maximum number of URLs whose resolved plugin is remembered
+RESOLVED_URLS_CACHE_SIZE = 128
+
 
 def print_small_exception(start_after):
     type, value, traceback_ = sys.exc_info()
@@ -61,6 +64,7 @@ class Livestreamer(object):
             "subprocess-errorlog": False
         })
         self.plugins = {}
+        self.resolved_urls = OrderedDict()
         self.logger = Logger()
         self.load_builtin_plugins()
 
@@ -323,8 +327,20 @@ class Livestreamer(object):
         if len(parsed.scheme) == 0:
             url = "http://" + url
 
+        # The same URL is often resolved more than once per session,
+        # so remember which plugin handled it and skip the probing.
+        if url in self.resolved_urls:
+            # Move it to the end so the least recently used URL is evicted
+            plugin = self.resolved_urls.pop(url)
+            self.resolved_urls[url] = plugin
+            return plugin(url)
+
         for name, plugin in self.plugins.items():
             if plugin.can_handle_url(url):
+                if len(self.resolved_urls) >= RESOLVED_URLS_CACHE_SIZE:
+                    self.resolved_urls.popitem(last=False)
+
+                self.resolved_urls[url] = plugin
                 obj = plugin(url)
                 return obj
 
@@ -335,7 +351,9 @@ class Livestreamer(object):
             # Fall back to GET request if server doesn't handle HEAD.
             if res.status_code == 501:
                 res = self.http.get(url, stream=True)
+                res.close()
 
+            # Redirects are not cached since their target may change
             if res.url != url:
                 return self.resolve_url(res.url)
         except PluginError:
@@ -392,6 +410,7 @@ class Livestreamer(object):
             plugin.bind(self, module_name)
 
             self.plugins[plugin.module] = plugin
+            self.resolved_urls.clear()
 
         if file:
             file.close()
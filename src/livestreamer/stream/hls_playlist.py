@@ -2,7 +2,6 @@ import re
 
 from binascii import unhexlify
 from collections import namedtuple
-from itertools import starmap
 
 try:
     from urlparse import urljoin
@@ -43,6 +42,7 @@ Segment = namedtuple("Segment", "uri duration title key discontinuity "
 
 ATTRIBUTE_REGEX = (r"([A-Z\-]+)=(\d+\.\d+|0x[0-9A-z]+|\d+x\d+|\d+|"
                    r"\"(.+?)\"|[0-9A-z\-]+)")
+_attribute_re = re.compile(ATTRIBUTE_REGEX)
 
 
 class M3U8(object):
@@ -104,12 +104,8 @@ class M3U8Parser(object):
         return None, None
 
     def parse_attributes(self, value):
-        def map_attribute(key, value, quoted):
-            return (key, quoted or value)
-
-        attr = re.findall(ATTRIBUTE_REGEX, value)
-
-        return dict(starmap(map_attribute, attr))
+        return dict((match.group(1), match.group(3) or match.group(2))
+                    for match in _attribute_re.finditer(value))
 
     def parse_bool(self, value):
         return value == "YES"
@@ -8,6 +8,12 @@ from ..exceptions import StreamError
 from ..packages import pbs as sh
 from ..utils import rtmpparse
 
+_param_re = re.compile("^--(\w+)", re.MULTILINE)
+
+# Arguments supported by each rtmpdump executable, so that
+# "rtmpdump --help" only has to be run once per executable.
+_supported_params = {}
+
 
 class RTMPStream(StreamProcess):
     """RTMP stream using rtmpdump.
@@ -106,6 +112,13 @@ class RTMPStream(StreamProcess):
                 self.params["tcUrl"] = redirect
 
     def _supports_param(self, param):
+        params = _supported_params.get(self.cmd)
+        if params is None:
+            params = _supported_params[self.cmd] = self._get_supported_params()
+
+        return param in params
+
+    def _get_supported_params(self):
         cmd = self._check_cmd()
 
         try:
@@ -114,16 +127,7 @@ class RTMPStream(StreamProcess):
             err = str(err.stdout, "ascii")
             raise StreamError("Error while checking rtmpdump compatibility: {0}".format(err))
 
-        for line in help.splitlines():
-            m = re.match("^--(\w+)", line)
-
-            if not m:
-                continue
-
-            if m.group(1) == param:
-                return True
-
-        return False
+        return set(_param_re.findall(str(help)))
 
     @classmethod
     def is_usable(cls, session):
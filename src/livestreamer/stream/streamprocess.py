@@ -1,13 +1,25 @@
 from .stream import Stream
 from .wrappers import StreamIOThreadWrapper
-from ..compat import str
+from ..compat import str, is_win32
 from ..exceptions import StreamError
 from ..packages import pbs as sh
 
 import os
+import struct
 import time
 import tempfile
 
+if not is_win32:
+    import fcntl
+    import termios
+
+
+def _pending_output(fd):
+    """Returns the number of bytes waiting to be read from a pipe."""
+    buf = fcntl.ioctl(fd, termios.FIONREAD, struct.pack("i", 0))
+    return struct.unpack("i", buf)[0]
+
+
 class StreamProcessIO(StreamIOThreadWrapper):
     def __init__(self, session, process, **kwargs):
         self.process = process
@@ -34,6 +46,7 @@ class StreamProcess(Stream):
 
         self.params = params
         self.errorlog = self.session.options.get("subprocess-errorlog")
+        self.errorlog_path = None
         self.timeout = timeout
 
     def open(self):
@@ -42,8 +55,15 @@ class StreamProcess(Stream):
         params["_bg"] = True
 
         if self.errorlog:
-            tmpfile = tempfile.NamedTemporaryFile(prefix="livestreamer",
-                                                  suffix=".err", delete=False)
+            # Append to the same log when the stream is opened again
+            if self.errorlog_path:
+                tmpfile = open(self.errorlog_path, "ab")
+            else:
+                tmpfile = tempfile.NamedTemporaryFile(prefix="livestreamer",
+                                                      suffix=".err",
+                                                      delete=False)
+                self.errorlog_path = tmpfile.name
+
             params["_err"] = tmpfile
         else:
             params["_err"] = open(os.devnull, "wb")
@@ -51,10 +71,18 @@ class StreamProcess(Stream):
         with params["_err"]:
             stream = cmd(**params)
 
-        # Wait 0.5 seconds to see if program exited prematurely
-        time.sleep(0.5)
+        # Wait up to 0.5 seconds to see if program exited prematurely,
+        # stop waiting early once it has started writing output
+        process = stream.process
+        elapsed = 0
+        while elapsed < 0.5 and process.poll() is None:
+            if not is_win32 and _pending_output(process.stdout.fileno()):
+                break
+
+            time.sleep(0.05)
+            elapsed += 0.05
 
-        process_alive = stream.process.returncode is None
+        process_alive = process.poll() is None
 
         if not process_alive:
             if self.errorlog:
@@ -1,7 +1,14 @@
-import json
 import re
 import zlib
 
+from json import loads as json_loads
+
+try:
+    from orjson import loads as orjson_loads
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 try:
     import xml.etree.cElementTree as ET
 except ImportError:
@@ -10,6 +17,8 @@ except ImportError:
 from .compat import urljoin, urlparse, parse_qsl, is_py2
 from .exceptions import PluginError
 
+_xmlns_re = re.compile(" xmlns=\"(.+?)\"")
+
 
 def swfdecompress(data):
     if data[:3] == b"CWS":
@@ -44,13 +53,29 @@ def prepend_www(url):
         return url
 
 
+def _json_loads(data):
+    if HAS_ORJSON:
+        try:
+            return orjson_loads(data)
+        except ValueError:
+            # orjson is stricter than the json module, e.g. it rejects
+            # NaN and lone surrogates, so let json have the final say
+            pass
+
+        # json only accepts bytes on Python 3.6+
+        if isinstance(data, bytes):
+            data = data.decode("utf8")
+
+    return json_loads(data)
+
+
 def parse_json(data, name="JSON", exception=PluginError, schema=None):
-    """Wrapper around json.loads.
+    """Wrapper around json.loads (or orjson.loads when available).
 
     Wraps errors in custom exception with a snippet of the data in the message.
     """
     try:
-        json_data = json.loads(data)
+        json_data = _json_loads(data)
     except ValueError as err:
         snippet = repr(data)
         if len(snippet) > 35:
@@ -78,7 +103,7 @@ def parse_xml(data, name="XML", ignore_ns=False, exception=PluginError, schema=N
         data = data.encode("utf8")
 
     if ignore_ns:
-        data = re.sub(" xmlns=\"(.+?)\"", "", data)
+        data = _xmlns_re.sub("", data)
 
     try:
         tree = ET.fromstring(data)
@@ -139,24 +164,29 @@ def rtmpparse(url):
 
 import requests
 
+from requests.compat import cookielib
+
+# Shared by urlget() callers that do not pass their own session, so that
+# repeated requests can reuse pooled keep-alive connections. It never
+# stores cookies, so they can't leak between unrelated calls (cookies set
+# during a call's own redirects are still sent along those redirects).
+_session = requests.Session()
+_session.cookies.set_policy(cookielib.DefaultCookiePolicy(allowed_domains=[]))
+
 def urlget(url, *args, **kwargs):
     """This function is deprecated."""
     data = kwargs.pop("data", None)
     exception = kwargs.pop("exception", PluginError)
     method = kwargs.pop("method", "GET")
-    session = kwargs.pop("session", None)
+    session = kwargs.pop("session", None) or _session
     timeout = kwargs.pop("timeout", 20)
 
     if data is not None:
         method = "POST"
 
     try:
-        if session:
-            res = session.request(method, url, timeout=timeout, data=data,
-                                  *args, **kwargs)
-        else:
-            res = requests.request(method, url, timeout=timeout, data=data,
-                                   *args, **kwargs)
+        res = session.request(method, url, timeout=timeout, data=data,
+                              *args, **kwargs)
 
         res.raise_for_status()
     except (requests.exceptions.RequestException, IOError) as rerr:
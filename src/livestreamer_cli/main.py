@@ -271,8 +271,13 @@ def output_stream(stream):
     return True
 
 
-def read_stream(stream, output, prebuffer, chunk_size=8192):
-    """Reads data from stream and then writes it to the output."""
+def read_stream(stream, output, prebuffer, chunk_size=1024 * 1024):
+    """Reads data from stream and then writes it to the output.
+
+    Streams return whatever data they have buffered, up to *chunk_size*,
+    so a large chunk size lowers the number of iterations without
+    delaying small reads.
+    """
     is_player = isinstance(output, PlayerOutput)
     is_http = isinstance(output, HTTPServer)
     is_fifo = is_player and output.namedpipe
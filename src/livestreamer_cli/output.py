@@ -11,6 +11,12 @@ from .utils import ignored
 
 if is_win32:
     import msvcrt
+else:
+    import fcntl
+
+# Linux only, not exposed by the fcntl module until Python 3.10
+F_SETPIPE_SZ = 1031
+PLAYER_PIPE_SIZE = 1024 * 1024
 
 
 class Output(object):
@@ -83,8 +89,7 @@ class PlayerOutput(Output):
             self.stdin = subprocess.PIPE
 
         if self.quiet:
-            self.stdout = open(os.devnull, "w")
-            self.stderr = open(os.devnull, "w")
+            self.stdout = self.stderr = open(os.devnull, "w")
         else:
             self.stdout = sys.stdout
             self.stderr = sys.stderr
@@ -140,6 +145,13 @@ class PlayerOutput(Output):
                                        stdout=self.stdout,
                                        stderr=self.stderr)
 
+        if self.stdin is subprocess.PIPE and sys.platform.startswith("linux"):
+            # A larger pipe lets the player absorb bursts of stream data
+            # without blocking our writes
+            with ignored(IOError, OSError):
+                fcntl.fcntl(self.player.stdin.fileno(), F_SETPIPE_SZ,
+                            PLAYER_PIPE_SIZE)
+
         # Wait 0.5 seconds to see if program exited prematurely
         if not self.running:
             raise OSError("Process exited prematurely")
@@ -0,0 +1,46 @@
+import time
+import unittest
+
+from livestreamer.plugin.api.mapper import StreamMapper, MAX_WORKERS
+
+
+class TestPluginAPIMapper(unittest.TestCase):
+    def create_mapper(self, concurrent):
+        def single(value):
+            # Finish the earlier values last to shuffle completion order
+            time.sleep((20 - value) * 0.001)
+            return "single_{0}".format(value), value
+
+        def multiple(value):
+            return [("multiple_{0}_{1}".format(value, i), value)
+                    for i in range(2)]
+
+        def nothing(value):
+            return None
+
+        mapper = StreamMapper(cmp=lambda key, value: value % 3 == key,
+                              concurrent=concurrent)
+        mapper.map(0, single)
+        mapper.map(1, multiple)
+        mapper.map(2, nothing)
+
+        return mapper
+
+    def test_concurrent_matches_sequential(self):
+        values = list(range(MAX_WORKERS * 2))
+        sequential = list(self.create_mapper(False)(values))
+        concurrent = list(self.create_mapper(True)(values))
+
+        self.assertEqual(concurrent, sequential)
+        self.assertEqual(sequential[:3], [("single_0", 0),
+                                          ("multiple_1_0", 1),
+                                          ("multiple_1_1", 1)])
+        self.assertFalse(any(name.endswith("_2") for name, value in sequential))
+
+    def test_concurrent_single_value(self):
+        mapper = self.create_mapper(True)
+        self.assertEqual(list(mapper([3])), [("single_3", 3)])
+        self.assertEqual(list(mapper([])), [])
+
+if __name__ == "__main__":
+    unittest.main()
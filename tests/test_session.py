@@ -3,6 +3,7 @@ import unittest
 
 from livestreamer import Livestreamer, PluginError, NoPluginError
 from livestreamer.plugins import Plugin
+from livestreamer.session import RESOLVED_URLS_CACHE_SIZE
 from livestreamer.stream import *
 
 
@@ -34,6 +35,24 @@ class TestSession(unittest.TestCase):
         self.assertTrue(isinstance(channel, Plugin))
         self.assertTrue(isinstance(channel, plugins["testplugin"]))
 
+    def test_resolve_url_cached(self):
+        channel = self.session.resolve_url("http://test.se/channel")
+        cached = self.session.resolve_url("http://test.se/channel")
+        self.assertTrue(cached is not channel)
+        self.assertTrue(type(cached) is type(channel))
+        self.assertEqual(cached.url, channel.url)
+
+        self.session.load_plugins(self.PluginPath)
+        self.assertEqual(len(self.session.resolved_urls), 0)
+
+    def test_resolve_url_cache_size(self):
+        for i in range(RESOLVED_URLS_CACHE_SIZE + 1):
+            self.session.resolve_url("http://test.se/channel{0}".format(i))
+
+        self.assertEqual(len(self.session.resolved_urls),
+                         RESOLVED_URLS_CACHE_SIZE)
+        self.assertFalse("http://test.se/channel0" in self.session.resolved_urls)
+
     def test_options(self):
         self.session.set_option("test_option", "option")
         self.assertEqual(self.session.get_option("test_option"), "option")